@@ -11,8 +11,13 @@ Options:
                         pr-<NUMBER>-<owner>-<repo>.md
     --filter MODE       Which comments to include.
                         all         : Every thread (default).
-                        unresolved  : Only threads with no replies yet.
+                        unresolved  : Only threads not marked resolved on
+                                      GitHub. Without a GitHub token, or
+                                      if the GraphQL API fails, resolution
+                                      is unknown and threads with no
+                                      replies yet are shown instead.
     --no-general        Exclude general (non-inline) PR comments.
+    --quiet             Suppress progress output (errors are still shown).
     --version           Show version and exit.
     --help              Show this message and exit.
 """
@@ -20,10 +25,20 @@ Options:
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from . import __version__
-from .fetcher import fetch_pr_info, fetch_review_comments, fetch_issue_comments, fetch_reviews, parse_pr_url
+from .fetcher import (
+    FetchError,
+    PRBundle,
+    fetch_issue_comments,
+    fetch_pr_bundle,
+    fetch_pr_info,
+    fetch_review_comments,
+    fetch_reviews,
+    parse_pr_url,
+)
 from .formatter import format_pr
 
 
@@ -44,28 +59,70 @@ def _resolve_output_path(output_arg: str | None, owner: str, repo: str, pr_numbe
     return p
 
 
+def _log(args: argparse.Namespace, *lines: str) -> None:
+    """Write progress lines to stdout in a single call, unless --quiet."""
+    if not args.quiet:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def _fetch_bundle_rest(owner: str, repo: str, pr_number: int, include_general: bool) -> PRBundle:
+    # The four REST fetches (direct API calls with a token, gh api without)
+    # are independent network round-trips, so run them concurrently.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pr_info_future = executor.submit(fetch_pr_info, owner, repo, pr_number)
+        review_comments_future = executor.submit(fetch_review_comments, owner, repo, pr_number)
+        issue_comments_future = None
+        if include_general:
+            issue_comments_future = executor.submit(fetch_issue_comments, owner, repo, pr_number)
+        reviews_future = executor.submit(fetch_reviews, owner, repo, pr_number)
+
+        try:
+            return PRBundle(
+                pr_info=pr_info_future.result(),
+                review_comments=review_comments_future.result(),
+                issue_comments=issue_comments_future.result() if issue_comments_future else [],
+                reviews=reviews_future.result(),
+            )
+        except FetchError:
+            # Surface only the first failure; the other workers' errors stay
+            # in their futures, and fetches that have not started are dropped.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
 def cmd_fetch(args: argparse.Namespace) -> None:
     pr_url = args.pr_url
     owner, repo, pr_number = parse_pr_url(pr_url)
 
-    print(f"Fetching PR #{pr_number} from {owner}/{repo}...")
+    _log(args, f"Fetching PR #{pr_number} from {owner}/{repo}...")
 
-    pr_info = fetch_pr_info(owner, repo, pr_number)
-    print(f"  - PR info: \"{pr_info.title}\"")
+    # GraphQL when possible; otherwise (no token, or a failed GraphQL call)
+    # the REST endpoints.
+    try:
+        bundle = fetch_pr_bundle(owner, repo, pr_number)
+        if bundle is None:
+            bundle = _fetch_bundle_rest(owner, repo, pr_number, include_general=not args.no_general)
+    except FetchError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
 
-    review_comments = fetch_review_comments(owner, repo, pr_number)
-    print(f"  - Inline review comments: {len(review_comments)}")
+    pr_info = bundle.pr_info
+    review_comments = bundle.review_comments
+    issue_comments: list[dict] = [] if args.no_general else bundle.issue_comments
+    reviews = bundle.reviews
 
-    issue_comments: list[dict] = []
+    progress = [
+        f"  - PR info: \"{pr_info.title}\"",
+        f"  - Inline review comments: {len(review_comments)}",
+    ]
     if not args.no_general:
-        issue_comments = fetch_issue_comments(owner, repo, pr_number)
-        print(f"  - General PR comments: {len(issue_comments)}")
-
-    reviews = fetch_reviews(owner, repo, pr_number)
-    print(f"  - Review summaries: {len(reviews)}")
+        progress.append(f"  - General PR comments: {len(issue_comments)}")
+    progress.append(f"  - Review summaries: {len(reviews)}")
+    progress.append(f"  Formatting as Markdown (filter={args.filter})...")
+    _log(args, *progress)
 
-    print(f"  Formatting as Markdown (filter={args.filter})...")
-    markdown = format_pr(
+    chunks, thread_count = format_pr(
         pr_info=pr_info,
         review_comments=review_comments,
         issue_comments=issue_comments,
@@ -74,9 +131,18 @@ def cmd_fetch(args: argparse.Namespace) -> None:
     )
 
     output_path = _resolve_output_path(args.output, owner, repo, pr_number)
-    output_path.write_text(markdown, encoding="utf-8")
-    print(f"\n Saved to: {output_path}")
-    print(f"   Threads shown: {markdown.count('### Thread')}")
+    # The document is rendered while it is written, so write it to a temp
+    # file next to the target and rename it into place: a failure midway
+    # leaves the previous export intact instead of a truncated file.
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            f.writelines(chunks)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _log(args, "", f" Saved to: {output_path}", f"   Threads shown: {thread_count}")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -128,7 +194,9 @@ def build_parser() -> argparse.ArgumentParser:
         help=(
             "Filter threads to show: "
             "'all' (default) shows every thread; "
-            "'unresolved' shows only threads with no replies yet."
+            "'unresolved' shows only threads not marked resolved on GitHub "
+            "(threads with no replies yet when the GraphQL API is not "
+            "available: no GitHub token, or a failed request)."
         ),
     )
     fetch_parser.add_argument(
@@ -137,6 +205,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Exclude general (non-inline) PR comments from the output.",
     )
+    fetch_parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        default=False,
+        help="Suppress progress output. Errors are still printed to stderr.",
+    )
     fetch_parser.set_defaults(func=cmd_fetch)
 
     return parser
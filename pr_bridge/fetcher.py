@@ -1,16 +1,58 @@
 """
-fetcher.py - Fetches PR data from GitHub using the gh CLI.
+fetcher.py - Fetches PR data from GitHub.
+
+When a GitHub token is available, everything is fetched through the
+GraphQL API. Otherwise (or when a GraphQL request fails) the data is
+fetched from the REST endpoints: directly over HTTPS with an
+ETag-validated disk cache when a token is available, through the gh CLI
+when it is not (or when GitHub rejects the token).
 """
 
+import hashlib
+import http.client
 import json
+import os
+import re
 import subprocess
 import sys
+import threading
+import time
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlsplit
+
+from . import __version__
+
+try:
+    # Optional speed-up for large payloads (pip install pr-bridge[fast]).
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so error
+    # handling is the same either way.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+REST_API_URL = "https://api.github.com"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pr-bridge"
+# Cache entries not used for this long (in seconds) are deleted.
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+_WS_RE = re.compile(r"[ \t\n\r]*")
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+# github.com/OWNER/REPO/pull/NUMBER, optionally followed by a sub-page
+# (/files, /commits, ...), a query string or a fragment.
+_PR_URL_RE = re.compile(
+    r"^(?:https?://)?(?:www\.)?github\.com/([^/\s]+)/([^/\s]+)/pull/(\d+)(?:[/?#]\S*)?$"
+)
 
 
-@dataclass
+class FetchError(Exception):
+    """Fetching from GitHub failed; str(error) is the message for the user."""
+
+
+@dataclass(slots=True, frozen=True)
 class PRInfo:
     owner: str
     repo: str
@@ -24,6 +66,39 @@ class PRInfo:
     body: str
 
 
+@dataclass(slots=True, frozen=True)
+class PRBundle:
+    """Everything needed to render a PR, in REST-shaped dicts."""
+    pr_info: PRInfo
+    review_comments: list[dict]
+    issue_comments: list[dict]
+    reviews: list[dict]
+
+
+def _decode_pages(raw: str) -> list:
+    """
+    Decode the concatenated JSON arrays gh prints for --paginate and flatten
+    them into one list.
+
+    Pages are decoded in place, one after another, with the stdlib
+    raw_decode even when orjson is installed: orjson cannot stop at the end
+    of a document, and locating page ends through its errors costs more
+    than the faster parse saves.
+    """
+    decoder = json.JSONDecoder()
+    combined: list = []
+    idx = _WS_RE.match(raw).end()
+    while idx < len(raw):
+        page, idx = decoder.raw_decode(raw, idx)
+        if isinstance(page, list):
+            combined.extend(page)
+        else:
+            combined.append(page)
+        # Skip whitespace between pages
+        idx = _WS_RE.match(raw, idx).end()
+    return combined
+
+
 def _run_gh(args: list[str]) -> dict | list:
     """
     Run a gh CLI command and return parsed JSON output.
@@ -38,75 +113,319 @@ def _run_gh(args: list[str]) -> dict | list:
             text=True,
             check=True,
         )
-        raw = result.stdout.strip()
-        if not raw:
+        raw = result.stdout
+        # Skip leading whitespace without copying the (possibly large) output.
+        idx = _WS_RE.match(raw).end()
+        if idx == len(raw):
             return []
 
-        # --paginate emits multiple JSON arrays back-to-back: [][]. Wrap them
-        # in a top-level array and let the decoder pick them up via raw_decode.
+        # --paginate emits multiple JSON arrays back-to-back: [][].
         paginated = args and "--paginate" in args
         if paginated:
-            decoder = json.JSONDecoder()
-            combined: list = []
-            idx = 0
-            while idx < len(raw):
-                # Skip whitespace between pages
-                while idx < len(raw) and raw[idx] in " \t\n\r":
-                    idx += 1
-                if idx >= len(raw):
-                    break
-                page, end_idx = decoder.raw_decode(raw, idx)
-                if isinstance(page, list):
-                    combined.extend(page)
-                else:
-                    combined.append(page)
-                idx = end_idx
-            return combined
+            return _decode_pages(raw)
 
-        return json.loads(raw)
+        return _json_loads(raw)
 
     except subprocess.CalledProcessError as e:
-        print(f"Error running gh CLI: {e.stderr.strip()}", file=sys.stderr)
-        sys.exit(1)
+        raise FetchError(f"Error running gh CLI: {e.stderr.strip()}") from None
     except FileNotFoundError:
-        print(
-            "Error: 'gh' CLI not found. Install it from https://cli.github.com/",
-            file=sys.stderr,
+        raise FetchError(
+            "Error: 'gh' CLI not found. Install it from https://cli.github.com/"
+        ) from None
+    except json.JSONDecodeError as e:
+        raise FetchError(f"Error parsing gh CLI output: {e}") from None
+
+
+# ---------------------------------------------------------------------------
+# Direct API access
+# ---------------------------------------------------------------------------
+
+class _TokenRejected(Exception):
+    """GitHub answered 401 Unauthorized for the token from _get_token()."""
+
+
+# Set once GitHub rejects the token; from then on everything goes through gh.
+_token_rejected = False
+
+# One keep-alive HTTPS connection per host for each thread.
+_local = threading.local()
+
+
+def _read_hosts_token(host: str = "github.com") -> Optional[str]:
+    """
+    Return the oauth_token gh stored for `host` in its hosts.yml, if any.
+
+    The file is simple enough to scan line by line, so no YAML parser is
+    needed. Newer gh versions keep the token in the system keyring instead,
+    in which case this returns None and the caller asks `gh auth token`.
+    """
+    config_dir = os.environ.get("GH_CONFIG_DIR")
+    if not config_dir:
+        config_dir = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config") / "gh"
+    try:
+        text = (Path(config_dir) / "hosts.yml").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+    # Only the host's direct children count: in multi-account files the
+    # per-user tokens are nested deeper (users: <name>: oauth_token:) and
+    # may come before the active account's host-level oauth_token.
+    in_host = False
+    child_indent: Optional[int] = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent == 0:
+            in_host = stripped.rstrip(":").strip("'\"") == host
+            child_indent = None
+            continue
+        if not in_host:
+            continue
+        if child_indent is None:
+            child_indent = indent
+        if indent != child_indent:
+            continue
+        key, _, value = stripped.partition(":")
+        if key == "oauth_token" and value.strip():
+            return value.strip().strip("'\"")
+    return None
+
+
+@lru_cache(maxsize=1)
+def _get_token() -> Optional[str]:
+    """
+    Return a GitHub token, if any: from GH_TOKEN / GITHUB_TOKEN, then gh's
+    hosts.yml, then `gh auth token` (only this last one forks a process).
+    """
+    for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        token = os.environ.get(var)
+        if token:
+            return token
+    token = _read_hosts_token()
+    if token:
+        return token
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            check=True,
         )
-        sys.exit(1)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _api_token() -> Optional[str]:
+    """Return the token for direct API calls, or None to go through gh."""
+    return None if _token_rejected else _get_token()
+
+
+def _reject_token() -> None:
+    global _token_rejected
+    if not _token_rejected:
+        _token_rejected = True
+        print("  GitHub rejected the token; falling back to the gh CLI.", file=sys.stderr)
+
+
+def _http_request(
+    token: str,
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    body: Optional[bytes] = None,
+) -> tuple[int, http.client.HTTPMessage, bytes]:
+    """
+    Send an authenticated API request and return (status, headers, body).
+
+    Requests reuse this thread's keep-alive connection to the host, so the
+    GraphQL query and every REST page share one TLS session instead of
+    reconnecting. A connection the server closed while idle is reopened
+    once, and redirects (e.g. for renamed repositories) are followed.
+
+    The token only ever goes out over HTTPS to the host of `url`: any other
+    URL, including a redirect to another host or scheme, raises FetchError.
+
+    Raises _TokenRejected on 401 Unauthorized.
+    """
+    host = urlsplit(url).netloc
+    connections = _local.__dict__.setdefault("connections", {})
+    headers = {
+        **headers,
+        "Authorization": f"Bearer {token}",
+        "User-Agent": f"pr-bridge/{__version__}",
+    }
+
+    for _ in range(5):
+        parts = urlsplit(url)
+        if parts.scheme != "https" or parts.netloc != host:
+            raise FetchError(f"Error calling GitHub API: refusing to send the token to {url}")
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        for attempt in range(2):
+            conn = connections.get(host)
+            if conn is None:
+                conn = connections[host] = http.client.HTTPSConnection(host, timeout=30)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                del connections[host]
+                if attempt:
+                    raise FetchError(f"Error connecting to GitHub: {e}") from None
+
+        location = response.headers.get("Location")
+        if response.status in (301, 302, 307, 308) and location:
+            url = urljoin(url, location)
+            continue
+        if response.status == 401:
+            raise _TokenRejected
+        return response.status, response.headers, data
+
+    raise FetchError(f"Error calling GitHub API: too many redirects ({url})")
+
+
+# ---------------------------------------------------------------------------
+# REST with conditional requests
+# ---------------------------------------------------------------------------
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_cache(url: str) -> Optional[dict]:
+    try:
+        return _json_loads(_cache_path(url).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(url: str, entry: dict) -> None:
+    # Write to a temp file and rename so a concurrent reader never sees a
+    # partial entry. The cache is best-effort: failures are ignored.
+    path = _cache_path(url)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _prune_cache() -> None:
+    """
+    Delete cache entries that have not been used for CACHE_MAX_AGE, along
+    with temp files left behind by interrupted writes. Runs once per process.
+    """
+    cutoff = time.time() - CACHE_MAX_AGE
+    try:
+        entries = list(os.scandir(CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def _describe_status(status: int, data: bytes) -> str:
+    """Return "HTTP <status>", plus the `message` GitHub put in the body, if any."""
+    try:
+        message = _json_loads(data).get("message")
+    except (ValueError, AttributeError):
+        message = None
+    if isinstance(message, str) and message:
+        return f"HTTP {status}: {message}"
+    return f"HTTP {status}"
+
+
+def _get_page(token: str, url: str) -> tuple[dict | list, Optional[str]]:
+    """
+    GET a single REST page and return (body, next_page_url).
+
+    A cached page is revalidated with If-None-Match; on 304 Not Modified the
+    cached body is returned without downloading it again.
+    """
+    cached = _read_cache(url)
+    headers = {"Accept": "application/vnd.github+json"}
+    if cached is not None:
+        headers["If-None-Match"] = cached["etag"]
+
+    status, response_headers, data = _http_request(token, "GET", url, headers)
+    if status == 304 and cached is not None:
+        # Mark the entry as recently used so _prune_cache keeps it.
+        try:
+            os.utime(_cache_path(url))
+        except OSError:
+            pass
+        return cached["body"], cached["next"]
+    if status != 200:
+        raise FetchError(f"Error calling GitHub API: {_describe_status(status, data)} ({url})")
+    try:
+        body = _json_loads(data)
     except json.JSONDecodeError as e:
-        print(f"Error parsing gh CLI output: {e}", file=sys.stderr)
-        sys.exit(1)
+        raise FetchError(f"Error parsing GitHub API response: {e}") from None
+
+    etag = response_headers.get("ETag")
+    match = _NEXT_LINK_RE.search(response_headers.get("Link") or "")
+    next_url = match.group(1) if match else None
+    if etag:
+        _write_cache(url, {"etag": etag, "body": body, "next": next_url})
+    return body, next_url
+
+
+def _api_get(path: str, paginate: bool = False) -> dict | list:
+    """
+    GET a REST API path, following pagination when `paginate` is set.
+
+    Goes straight to the API (with the disk cache) when a usable token is
+    available, and through `gh api` otherwise.
+    """
+    token = _api_token()
+    if token is not None:
+        _prune_cache()
+        url = f"{REST_API_URL}/{path}"
+        try:
+            if not paginate:
+                return _get_page(token, url)[0]
+
+            combined: list = []
+            next_url: Optional[str] = f"{url}?per_page=100"
+            while next_url is not None:
+                page, next_url = _get_page(token, next_url)
+                combined.extend(page)
+            return combined
+        except _TokenRejected:
+            _reject_token()
+
+    return _run_gh(["api", "--paginate", path] if paginate else ["api", path])
 
 
 def parse_pr_url(url: str) -> tuple[str, str, int]:
     """Parse GitHub PR URL and return (owner, repo, pr_number)."""
-    parsed = urlparse(url)
-    parts = parsed.path.strip("/").split("/")
-    # Expected: github.com/owner/repo/pull/NUMBER
-    if len(parts) < 4 or parts[2] != "pull":
+    match = _PR_URL_RE.match(url.strip())
+    if match is None:
         print(
             f"Error: Invalid PR URL format: {url}\n"
             "Expected: https://github.com/owner/repo/pull/NUMBER",
             file=sys.stderr,
         )
         sys.exit(1)
-    try:
-        owner = parts[0]
-        repo = parts[1]
-        pr_number = int(parts[3])
-    except (ValueError, IndexError):
-        print(f"Error: Could not parse PR number from URL: {url}", file=sys.stderr)
-        sys.exit(1)
-    return owner, repo, pr_number
+    owner, repo, pr_number = match.groups()
+    return owner, repo, int(pr_number)
 
 
 def fetch_pr_info(owner: str, repo: str, pr_number: int) -> PRInfo:
     """Fetch basic PR metadata."""
-    data = _run_gh([
-        "api",
-        f"repos/{owner}/{repo}/pulls/{pr_number}",
-    ])
+    data = _api_get(f"repos/{owner}/{repo}/pulls/{pr_number}")
     return PRInfo(
         owner=owner,
         repo=repo,
@@ -126,11 +445,7 @@ def fetch_review_comments(owner: str, repo: str, pr_number: int) -> list[dict]:
     Fetch inline review comments (pull request review comments).
     These are comments attached to specific lines in the diff.
     """
-    return _run_gh([
-        "api",
-        "--paginate",
-        f"repos/{owner}/{repo}/pulls/{pr_number}/comments",
-    ])
+    return _api_get(f"repos/{owner}/{repo}/pulls/{pr_number}/comments", paginate=True)
 
 
 def fetch_issue_comments(owner: str, repo: str, pr_number: int) -> list[dict]:
@@ -138,16 +453,262 @@ def fetch_issue_comments(owner: str, repo: str, pr_number: int) -> list[dict]:
     Fetch general PR comments (issue-level comments, i.e. the comment box
     below the PR description, not inline diff comments).
     """
-    return _run_gh([
-        "api",
-        "--paginate",
-        f"repos/{owner}/{repo}/issues/{pr_number}/comments",
-    ])
+    return _api_get(f"repos/{owner}/{repo}/issues/{pr_number}/comments", paginate=True)
 
 
 def fetch_reviews(owner: str, repo: str, pr_number: int) -> list[dict]:
     """Fetch review summaries (APPROVED, CHANGES_REQUESTED, COMMENTED, etc.)."""
-    return _run_gh([
-        "api",
-        f"repos/{owner}/{repo}/pulls/{pr_number}/reviews",
-    ])
+    return _api_get(f"repos/{owner}/{repo}/pulls/{pr_number}/reviews", paginate=True)
+
+
+# ---------------------------------------------------------------------------
+# GraphQL
+# ---------------------------------------------------------------------------
+
+# Node selections shared by the first query and the follow-up page queries.
+_PAGE_INFO = "pageInfo { hasNextPage endCursor }"
+_REVIEW_NODE = "state body submittedAt author { login }"
+_ISSUE_COMMENT_NODE = "body createdAt url authorAssociation author { login }"
+_REVIEW_COMMENT_NODE = (
+    "databaseId body path line originalLine diffHunk createdAt url"
+    " authorAssociation author { login }"
+)
+_THREAD_NODE = (
+    f"id isResolved comments(first: 100) {{ {_PAGE_INFO} nodes {{ {_REVIEW_COMMENT_NODE} }} }}"
+)
+
+_PR_BUNDLE_QUERY = f"""
+query($owner: String!, $repo: String!, $number: Int!) {{
+  repository(owner: $owner, name: $repo) {{
+    pullRequest(number: $number) {{
+      title
+      url
+      state
+      body
+      baseRefName
+      headRefName
+      author {{ login }}
+      reviews(first: 100) {{ {_PAGE_INFO} nodes {{ {_REVIEW_NODE} }} }}
+      reviewThreads(first: 100) {{ {_PAGE_INFO} nodes {{ {_THREAD_NODE} }} }}
+      comments(first: 100) {{ {_PAGE_INFO} nodes {{ {_ISSUE_COMMENT_NODE} }} }}
+    }}
+  }}
+}}
+"""
+
+# Later pages of one of the pull request's top-level connections.
+_PR_CONNECTION_QUERIES = {
+    name: f"""
+query($owner: String!, $repo: String!, $number: Int!, $after: String!) {{
+  repository(owner: $owner, name: $repo) {{
+    pullRequest(number: $number) {{
+      {name}(first: 100, after: $after) {{ {_PAGE_INFO} nodes {{ {node} }} }}
+    }}
+  }}
+}}
+"""
+    for name, node in (
+        ("reviews", _REVIEW_NODE),
+        ("reviewThreads", _THREAD_NODE),
+        ("comments", _ISSUE_COMMENT_NODE),
+    )
+}
+
+# Later pages of the comments in one review thread.
+_THREAD_COMMENTS_QUERY = f"""
+query($id: ID!, $after: String!) {{
+  node(id: $id) {{
+    ... on PullRequestReviewThread {{
+      comments(first: 100, after: $after) {{ {_PAGE_INFO} nodes {{ {_REVIEW_COMMENT_NODE} }} }}
+    }}
+  }}
+}}
+"""
+
+
+def _run_graphql(token: str, query: str, variables: dict) -> Optional[dict]:
+    """
+    POST a GraphQL query and return its `data` object.
+
+    GraphQL is only a shortcut, so failures that the REST endpoints may
+    not share (5xx timeouts on the nested query, secondary rate limits,
+    query errors) print a note and return None for the caller to fall
+    back. A missing repository or PR still raises FetchError, as REST would.
+    """
+    status, _, data = _http_request(
+        token,
+        "POST",
+        GRAPHQL_URL,
+        {"Content-Type": "application/json"},
+        json.dumps({"query": query, "variables": variables}).encode("utf-8"),
+    )
+    if status != 200:
+        print(
+            f"  GitHub GraphQL API returned {_describe_status(status, data)}; "
+            "falling back to REST.",
+            file=sys.stderr,
+        )
+        return None
+    try:
+        payload = _json_loads(data)
+    except json.JSONDecodeError as e:
+        print(f"  Could not parse GitHub GraphQL response ({e}); falling back to REST.", file=sys.stderr)
+        return None
+
+    errors = payload.get("errors")
+    if errors:
+        messages = "; ".join(err.get("message", "") for err in errors)
+        if any(err.get("type") == "NOT_FOUND" for err in errors):
+            raise FetchError(f"Error from GitHub GraphQL API: {messages}")
+        print(f"  GitHub GraphQL API error ({messages}); falling back to REST.", file=sys.stderr)
+        return None
+    return payload["data"]
+
+
+# REST only knows open/closed; a merged PR is "closed" there.
+_GRAPHQL_PR_STATES = {"OPEN": "open", "CLOSED": "closed", "MERGED": "closed"}
+
+
+def _login(node: dict) -> str:
+    # Deleted accounts come back as a null author; REST calls them "ghost".
+    return (node.get("author") or {}).get("login", "ghost")
+
+
+def _complete_connection(
+    token: str,
+    connection: dict,
+    query: str,
+    variables: dict,
+    path: tuple[str, ...],
+) -> bool:
+    """
+    Append the remaining pages of `connection` to its nodes, requesting them
+    with `query` (`path` leads from the query's data to the connection).
+
+    Returns False if a page could not be fetched.
+    """
+    page_info = connection["pageInfo"]
+    while page_info["hasNextPage"]:
+        page = _run_graphql(token, query, {**variables, "after": page_info["endCursor"]})
+        for key in path:
+            page = (page or {}).get(key)
+        if page is None:
+            return False
+        connection["nodes"].extend(page["nodes"])
+        page_info = page["pageInfo"]
+    return True
+
+
+def _query_pr(token: str, owner: str, repo: str, pr_number: int) -> Optional[dict]:
+    """
+    Return the pullRequest object of _PR_BUNDLE_QUERY with every connection
+    paged through to the end, or None if a GraphQL request fails.
+    """
+    variables = {"owner": owner, "repo": repo, "number": pr_number}
+    data = _run_graphql(token, _PR_BUNDLE_QUERY, variables)
+    if data is None:
+        return None
+    pr = (data.get("repository") or {}).get("pullRequest")
+    if pr is None:
+        raise FetchError(f"Error: PR #{pr_number} not found in {owner}/{repo}")
+
+    for name, query in _PR_CONNECTION_QUERIES.items():
+        path = ("repository", "pullRequest", name)
+        if not _complete_connection(token, pr[name], query, variables, path):
+            return None
+    for thread in pr["reviewThreads"]["nodes"]:
+        variables = {"id": thread["id"]}
+        if not _complete_connection(
+            token, thread["comments"], _THREAD_COMMENTS_QUERY, variables, ("node", "comments")
+        ):
+            return None
+    return pr
+
+
+def fetch_pr_bundle(owner: str, repo: str, pr_number: int) -> Optional[PRBundle]:
+    """
+    Fetch PR metadata, inline comments, general comments and reviews through
+    the GraphQL API: one request, plus one per further page of any
+    connection with more than 100 items.
+
+    The results are converted to the same dict shapes the REST endpoints
+    return, so the formatter does not care which path was used. Inline
+    comments additionally carry `is_resolved`, taken from the thread's
+    `isResolved` flag.
+
+    Returns None when no usable token is available or when a GraphQL request
+    fails, in which case the caller should use the REST fetchers.
+    """
+    token = _api_token()
+    if token is None:
+        return None
+
+    try:
+        pr = _query_pr(token, owner, repo, pr_number)
+    except _TokenRejected:
+        _reject_token()
+        return None
+    if pr is None:
+        return None
+
+    pr_info = PRInfo(
+        owner=owner,
+        repo=repo,
+        number=pr_number,
+        title=pr.get("title", ""),
+        author=_login(pr),
+        url=pr.get("url", ""),
+        base_branch=pr.get("baseRefName", ""),
+        head_branch=pr.get("headRefName", ""),
+        state=_GRAPHQL_PR_STATES.get(pr.get("state"), ""),
+        body=pr.get("body") or "",
+    )
+
+    review_comments = []
+    for thread in pr["reviewThreads"]["nodes"]:
+        root_id = None
+        for node in thread["comments"]["nodes"]:
+            review_comments.append({
+                "id": node["databaseId"],
+                "user": {"login": _login(node)},
+                "body": node.get("body"),
+                "path": node.get("path", ""),
+                "line": node.get("line"),
+                "original_line": node.get("originalLine"),
+                "diff_hunk": node.get("diffHunk", ""),
+                "created_at": node.get("createdAt", ""),
+                "html_url": node.get("url", ""),
+                "in_reply_to_id": root_id,
+                "author_association": node.get("authorAssociation", ""),
+                "is_resolved": thread["isResolved"],
+            })
+            if root_id is None:
+                root_id = node["databaseId"]
+
+    issue_comments = [
+        {
+            "user": {"login": _login(node)},
+            "body": node.get("body"),
+            "created_at": node.get("createdAt", ""),
+            "html_url": node.get("url", ""),
+            "author_association": node.get("authorAssociation", ""),
+        }
+        for node in pr["comments"]["nodes"]
+    ]
+
+    reviews = [
+        {
+            "user": {"login": _login(node)},
+            "state": node.get("state", ""),
+            "body": node.get("body"),
+            "submitted_at": node.get("submittedAt"),
+        }
+        for node in pr["reviews"]["nodes"]
+    ]
+
+    return PRBundle(
+        pr_info=pr_info,
+        review_comments=review_comments,
+        issue_comments=issue_comments,
+        reviews=reviews,
+    )
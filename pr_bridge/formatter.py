@@ -13,17 +13,28 @@ Design goals:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional
+import re
+from dataclasses import dataclass
+from itertools import chain
+from operator import itemgetter
+from typing import Iterator, Optional, Sequence
 
 from .fetcher import PRInfo
 
 
+# Every line boundary str.splitlines() recognizes, other than a plain \n.
+_LINE_BREAK = re.compile(r"\r\n?|[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+# Whitespace right before a newline.
+_TRAILING_WS = re.compile(r"[^\S\n]+(?=\n)")
+
+_MEANINGFUL_REVIEW_STATES = frozenset({"APPROVED", "CHANGES_REQUESTED", "DISMISSED"})
+
+
 # ---------------------------------------------------------------------------
 # Internal data model
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReviewComment:
     id: int
     author: str
@@ -36,25 +47,28 @@ class ReviewComment:
     in_reply_to_id: Optional[int]
     is_suggestion: bool  # body contains a ```suggestion block
     author_association: str  # MEMBER, CONTRIBUTOR, OWNER, NONE …
+    thread_resolved: Optional[bool] = None  # GraphQL isResolved; None via REST
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommentThread:
     """A top-level inline comment together with all its replies."""
     root: ReviewComment
-    replies: list[ReviewComment] = field(default_factory=list)
+    replies: Sequence[ReviewComment] = ()
 
     @property
     def is_resolved(self) -> bool:
         """
-        GitHub does not expose 'resolved' state in the REST API for individual
-        comments. We infer it: if the PR author (or anyone) has replied to the
-        thread, we consider it 'addressed'. Strictly unresolved means no replies
-        at all from any participant.
+        When the data came from the GraphQL API, the thread's `isResolved`
+        flag is used as-is.
 
-        Note: The GraphQL API exposes `isResolved` directly, but we intentionally
-        avoid GraphQL to keep the gh-CLI dependency simple.
+        The REST API does not expose 'resolved' state for individual comments,
+        so for REST data we infer it: if the PR author (or anyone) has replied
+        to the thread, we consider it 'addressed'. Strictly unresolved means no
+        replies at all from any participant.
         """
+        if self.root.thread_resolved is not None:
+            return self.root.thread_resolved
         return len(self.replies) > 0
 
 
@@ -63,8 +77,8 @@ class CommentThread:
 # ---------------------------------------------------------------------------
 
 def _clean_body(body: str) -> str:
-    """Strip trailing whitespace from each line."""
-    return "\n".join(line.rstrip() for line in body.splitlines()).strip()
+    """Normalize line breaks to newlines and strip trailing whitespace from each line."""
+    return _TRAILING_WS.sub("", _LINE_BREAK.sub("\n", body)).strip()
 
 
 def _is_suggestion(body: str) -> bool:
@@ -77,8 +91,11 @@ def _extract_diff_hunk_tail(diff_hunk: str, context_lines: int = 6) -> str:
     The full hunk can be very long; the tail is what actually triggered
     the comment.
     """
-    lines = diff_hunk.splitlines()
-    return "\n".join(lines[-context_lines:]) if len(lines) > context_lines else diff_hunk
+    # rsplit with a limit only scans from the end of the hunk, and stops
+    # after `context_lines` splits. A final newline ends the last line
+    # rather than starting a new one, as with splitlines().
+    parts = diff_hunk.removesuffix("\n").rsplit("\n", context_lines)
+    return "\n".join(parts[1:]) if len(parts) > context_lines else diff_hunk
 
 
 def _build_threads(raw_comments: list[dict]) -> list[CommentThread]:
@@ -91,18 +108,20 @@ def _build_threads(raw_comments: list[dict]) -> list[CommentThread]:
     replies: dict[int, list[ReviewComment]] = {}  # parent_id -> [reply, ...]
 
     for raw in raw_comments:
+        body = raw.get("body") or ""
         comment = ReviewComment(
             id=raw["id"],
             author=raw["user"]["login"],
-            body=_clean_body(raw.get("body") or ""),
+            body=_clean_body(body),
             path=raw.get("path", ""),
             line=raw.get("original_line") or raw.get("line"),
             diff_hunk=raw.get("diff_hunk", ""),
             created_at=raw.get("created_at", ""),
             html_url=raw.get("html_url", ""),
             in_reply_to_id=raw.get("in_reply_to_id"),
-            is_suggestion=_is_suggestion(raw.get("body") or ""),
+            is_suggestion=_is_suggestion(body),
             author_association=raw.get("author_association", ""),
+            thread_resolved=raw.get("is_resolved"),
         )
         by_id[comment.id] = comment
 
@@ -111,138 +130,129 @@ def _build_threads(raw_comments: list[dict]) -> list[CommentThread]:
         else:
             replies.setdefault(comment.in_reply_to_id, []).append(comment)
 
-    threads = []
-    for root in roots:
-        thread = CommentThread(root=root, replies=replies.get(root.id, []))
-        threads.append(thread)
-
-    # Sort threads by file path then line number for a consistent reading order
-    threads.sort(key=lambda t: (t.root.path, t.root.line or 0))
-    return threads
+    # Sort threads by file path then line number for a consistent reading
+    # order. The sort key is built alongside each thread so the sort itself
+    # only compares ready-made tuples.
+    keyed = [
+        ((root.path, root.line or 0), CommentThread(root=root, replies=replies.get(root.id, ())))
+        for root in roots
+    ]
+    keyed.sort(key=itemgetter(0))
+    return [thread for _, thread in keyed]
 
 
 # ---------------------------------------------------------------------------
 # Markdown rendering
 # ---------------------------------------------------------------------------
 
-def _render_comment_body(comment: ReviewComment, indent: str = "") -> str:
-    lines = []
-    lines.append(f"{indent}**@{comment.author}** ({comment.author_association.lower()}) "
-                 f"· {comment.created_at[:10]}")
-    lines.append(f"{indent}[view on GitHub]({comment.html_url})")
-    lines.append("")
-    for line in comment.body.splitlines():
-        lines.append(f"{indent}{line}")
-    return "\n".join(lines)
+def _render_comment_body(comment: ReviewComment, indent: str = "") -> Iterator[str]:
+    yield (f"{indent}**@{comment.author}** ({comment.author_association.lower()}) "
+           f"· {comment.created_at[:10]}")
+    yield f"{indent}[view on GitHub]({comment.html_url})"
+    yield ""
+    if not comment.body:
+        return
+    # Prefix every line in one pass; _clean_body already normalized all
+    # line endings to \n.
+    if indent:
+        yield indent + comment.body.replace("\n", "\n" + indent)
+    else:
+        yield comment.body
 
 
-def _render_thread(thread: CommentThread, index: int) -> str:
-    parts = []
+def _render_thread(thread: CommentThread, index: int) -> Iterator[str]:
     root = thread.root
     status = "addressed" if thread.is_resolved else "**OPEN**"
 
-    parts.append(f"### Thread {index} — `{root.path}` (line {root.line}) [{status}]")
-    parts.append("")
+    yield f"### Thread {index} — `{root.path}` (line {root.line}) [{status}]"
+    yield ""
 
     # Diff context
     hunk_tail = _extract_diff_hunk_tail(root.diff_hunk)
-    parts.append("**Diff context:**")
-    parts.append("```diff")
-    parts.append(hunk_tail)
-    parts.append("```")
-    parts.append("")
+    yield "**Diff context:**"
+    yield "```diff"
+    yield hunk_tail
+    yield "```"
+    yield ""
 
     # Root comment
-    parts.append(_render_comment_body(root))
-    parts.append("")
+    yield from _render_comment_body(root)
+    yield ""
 
     # Replies
     if thread.replies:
-        parts.append("**Replies:**")
-        parts.append("")
+        yield "**Replies:**"
+        yield ""
         for reply in thread.replies:
-            parts.append(_render_comment_body(reply, indent="> "))
-            parts.append(">")
-            parts.append("")
-
-    return "\n".join(parts)
+            yield from _render_comment_body(reply, indent="> ")
+            yield ">"
+            yield ""
 
 
-def format_pr(
+def _render_document(
     pr_info: PRInfo,
-    review_comments: list[dict],
+    threads: list[CommentThread],
     issue_comments: list[dict],
     reviews: list[dict],
-    filter_mode: str = "all",  # "all" | "unresolved"
-) -> str:
-    """
-    Build the full Markdown document.
-
-    Parameters
-    ----------
-    pr_info        : Basic PR metadata.
-    review_comments: Inline diff comments (from /pulls/{n}/comments).
-    issue_comments : General PR comments (from /issues/{n}/comments).
-    reviews        : Review summaries (from /pulls/{n}/reviews).
-    filter_mode    : "all" keeps every thread; "unresolved" drops threads
-                     that already have at least one reply.
-    """
-    threads = _build_threads(review_comments)
-
-    if filter_mode == "unresolved":
-        threads = [t for t in threads if not t.is_resolved]
-
-    lines = []
-
+    filter_mode: str,
+    resolved_from_github: Optional[bool],
+) -> Iterator[str]:
     # -----------------------------------------------------------------------
     # Header
     # -----------------------------------------------------------------------
-    lines.append(f"# PR #{pr_info.number}: {pr_info.title}")
-    lines.append("")
-    lines.append(f"- **Repository:** {pr_info.owner}/{pr_info.repo}")
-    lines.append(f"- **Author:** @{pr_info.author}")
-    lines.append(f"- **State:** {pr_info.state}")
-    lines.append(f"- **Branch:** `{pr_info.head_branch}` → `{pr_info.base_branch}`")
-    lines.append(f"- **URL:** {pr_info.url}")
-    lines.append(f"- **Filter:** {filter_mode}")
-    lines.append("")
+    # Adjacent f-strings compile to a single string build, so the whole
+    # header is formatted in one step.
+    yield (
+        f"# PR #{pr_info.number}: {pr_info.title}\n"
+        "\n"
+        f"- **Repository:** {pr_info.owner}/{pr_info.repo}\n"
+        f"- **Author:** @{pr_info.author}\n"
+        f"- **State:** {pr_info.state}\n"
+        f"- **Branch:** `{pr_info.head_branch}` → `{pr_info.base_branch}`\n"
+        f"- **URL:** {pr_info.url}\n"
+        f"- **Filter:** {filter_mode}\n"
+    )
 
     # -----------------------------------------------------------------------
     # Review summaries
     # -----------------------------------------------------------------------
-    meaningful_reviews = [
-        r for r in reviews
-        if r.get("state") in ("APPROVED", "CHANGES_REQUESTED", "DISMISSED")
-        and r.get("user", {}).get("login") != "ghost"
-    ]
+    meaningful_reviews = []
+    for r in reviews:
+        state = r.get("state")
+        reviewer = (r.get("user") or {}).get("login", "unknown")
+        if state in _MEANINGFUL_REVIEW_STATES and reviewer != "ghost":
+            meaningful_reviews.append((r, reviewer, state))
     if meaningful_reviews:
-        lines.append("## Review Summaries")
-        lines.append("")
-        for r in meaningful_reviews:
-            reviewer = r.get("user", {}).get("login", "unknown")
-            state = r.get("state", "")
+        yield "## Review Summaries"
+        yield ""
+        for r, reviewer, state in meaningful_reviews:
             submitted = (r.get("submitted_at") or "")[:10]
             body = _clean_body(r.get("body") or "")
-            lines.append(f"- **@{reviewer}** — `{state}` ({submitted})")
+            yield f"- **@{reviewer}** — `{state}` ({submitted})"
             if body:
-                lines.append(f"  > {body[:200]}{'…' if len(body) > 200 else ''}")
-        lines.append("")
+                yield f"  > {body[:200]}{'…' if len(body) > 200 else ''}"
+        yield ""
 
     # -----------------------------------------------------------------------
     # Inline review threads
     # -----------------------------------------------------------------------
-    lines.append("## Inline Review Comments")
-    lines.append("")
+    yield "## Inline Review Comments"
+    yield ""
 
     if not threads:
-        lines.append("_No inline review comments found for the selected filter._")
-        lines.append("")
+        yield "_No inline review comments found for the selected filter._"
     else:
-        lines.append(
+        yield (
             f"_{len(threads)} thread(s) shown "
             f"({'open only' if filter_mode == 'unresolved' else 'all, including addressed'})._"
         )
-        lines.append("")
+    # Say where "addressed" came from, since the two sources can disagree.
+    if resolved_from_github:
+        yield "_Resolved state: as marked on GitHub._"
+    elif resolved_from_github is not None:
+        yield "_Resolved state: inferred (a thread with at least one reply counts as addressed)._"
+    yield ""
+    if threads:
 
         # Group by file for easier navigation
         current_file = None
@@ -250,28 +260,66 @@ def format_pr(
         for thread in threads:
             if thread.root.path != current_file:
                 current_file = thread.root.path
-                lines.append(f"---")
-                lines.append(f"## File: `{current_file}`")
-                lines.append("")
-            lines.append(_render_thread(thread, thread_index))
+                yield "---"
+                yield f"## File: `{current_file}`"
+                yield ""
+            yield from _render_thread(thread, thread_index)
             thread_index += 1
 
     # -----------------------------------------------------------------------
     # General (issue-level) PR comments
     # -----------------------------------------------------------------------
     if issue_comments:
-        lines.append("---")
-        lines.append("## General PR Comments")
-        lines.append("")
+        yield "---"
+        yield "## General PR Comments"
+        yield ""
         for c in issue_comments:
-            author = c.get("user", {}).get("login", "unknown")
+            author = (c.get("user") or {}).get("login", "unknown")
             association = c.get("author_association", "").lower()
             created = (c.get("created_at") or "")[:10]
             body = _clean_body(c.get("body") or "")
             html_url = c.get("html_url", "")
-            lines.append(f"**@{author}** ({association}) · {created} · [view]({html_url})")
-            lines.append("")
-            lines.append(body)
-            lines.append("")
+            yield f"**@{author}** ({association}) · {created} · [view]({html_url})"
+            yield ""
+            yield body
+            yield ""
+
+
+def format_pr(
+    pr_info: PRInfo,
+    review_comments: list[dict],
+    issue_comments: list[dict],
+    reviews: list[dict],
+    filter_mode: str = "all",  # "all" | "unresolved"
+) -> tuple[Iterator[str], int]:
+    """
+    Build the full Markdown document.
+
+    Returns the document as an iterator of text chunks, to be written out as
+    it is rendered, and the number of threads it shows.
+    Threads are built up front so the count is known before rendering.
+
+    Parameters
+    ----------
+    pr_info        : Basic PR metadata.
+    review_comments: Inline diff comments (from /pulls/{n}/comments).
+    issue_comments : General PR comments (from /issues/{n}/comments).
+    reviews        : Review summaries (from /pulls/{n}/reviews).
+    filter_mode    : "all" keeps every thread; "unresolved" drops threads
+                     that are resolved (GraphQL) or already have at least
+                     one reply (REST).
+    """
+    threads = _build_threads(review_comments)
+    # None when there are no threads to be resolved or not.
+    resolved_from_github = threads[0].root.thread_resolved is not None if threads else None
+
+    if filter_mode == "unresolved":
+        threads = [t for t in threads if not t.is_resolved]
 
-    return "\n".join(lines)
+    lines = _render_document(
+        pr_info, threads, issue_comments, reviews, filter_mode, resolved_from_github
+    )
+    # Emit the same separators "\n".join(lines) would, but lazily. The
+    # document always starts with the header, so there is a first line.
+    chunks = chain([next(lines)], (f"\n{line}" for line in lines))
+    return chunks, len(threads)